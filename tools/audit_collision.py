@@ -0,0 +1,40 @@
+
+# headless version of "Audit Unreal Collision"
+
+# usage:
+#   blender --background level.blend --python tools/audit_collision.py -- <report.csv|report.json> [oversize ratio]
+#   prints the summary and writes the report, the exit code is 1 when any asset is missing collision or has stale or misfit collision, or collision has no asset (orphan)
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bpy
+from unreal_collision import audit
+
+def main():
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    if len(argv) == 0:
+        print("usage: blender --background level.blend --python tools/audit_collision.py -- <report.csv|report.json> [oversize ratio]")
+        sys.exit(2)
+
+    oversize_ratio = float(argv[1]) if len(argv) > 1 else 4.0
+
+    start = time.perf_counter()
+    rows = audit.audit_scene(bpy.context.scene, oversize_ratio=oversize_ratio)
+    audit.write_report(rows, argv[0])
+    elapsed = time.perf_counter() - start
+
+    summary = audit.get_summary(rows)
+    print("%d objects audited in %.2f s" % (len(bpy.context.scene.objects), elapsed))
+    for key, value in summary.items():
+        print("  %-10s %d" % (key, value))
+
+    failed = summary["missing"] + summary["stale"] + summary["misfit"] + summary["orphan"]
+    sys.exit(1 if failed > 0 else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+
+# time the UBX_ box merge pass on synthetic collections
+
+# usage:
+#   blender --background --factory-startup --python tools/benchmark_merge.py -- [box count]
+#   the default box count is 3000
+
+# cases:
+#   spread      boxes scattered over a large area, almost no overlaps
+#   stacked     every box an exact copy of the same box, what repeated runs of the box operators leave behind
+#   near        copies of the same box moved and scaled a little, nothing identical and nothing inside another box
+#   rotated     like near, with a different rotation for every box so nothing can be merged
+#               the worst case, every box overlaps every other box so the time grows with the square of the box count
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from unreal_collision import merge
+
+def make_axes(n, rng, rotated):
+    if not rotated:
+        return np.repeat(np.eye(3)[None], n, axis=0)
+    q, _ = np.linalg.qr(rng.normal(size=(n, 3, 3)))
+    return q
+
+def make_case(name, n, rng):
+    if name == "spread":
+        return rng.uniform(0.0, 100.0 * n ** (1.0 / 3.0), (n, 3)), make_axes(n, rng, False), rng.uniform(0.5, 2.0, (n, 3))
+    if name == "stacked":
+        return np.tile([1.0, 2.0, 3.0], (n, 1)), make_axes(n, rng, False), np.tile([1.0, 0.5, 2.0], (n, 1))
+    center = np.array([1.0, 2.0, 3.0]) + rng.uniform(-0.05, 0.05, (n, 3))
+    half = np.array([1.0, 0.5, 2.0]) * rng.uniform(0.97, 1.03, (n, 3))
+    return center, make_axes(n, rng, name == "rotated"), half
+
+def main():
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    n = int(argv[0]) if len(argv) > 0 else 3000
+
+    rng = np.random.default_rng(0)
+    for name in ("spread", "stacked", "near", "rotated"):
+        center, axes, half = make_case(name, n, rng)
+
+        start = time.perf_counter()
+        removed, modified = merge.merge_boxes(center, axes, half, 0.8, 0.001)
+        elapsed = time.perf_counter() - start
+
+        print("%-8s %6d boxes  %8.3f s  removed %6d  resized %6d" % (name, n, elapsed, int(np.sum(removed)), int(np.sum(modified))))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+
+# time the OBB fit of single objects and of groups of objects against the plain PCA fit of their world vertices
+
+# usage:
+#   blender --background --factory-startup --python tools/benchmark_obb.py -- [vertex count] [object count]
+#   the default vertex count is 100000 for the single objects, the group splits 2000000 vertices over the objects, 500 by default
+
+# cases:
+#   symmetric   box shaped point cloud modeled axis-aligned, mirrored about the local axes, rotated and scaled on the object
+#   bracket     L shaped bracket modeled axis-aligned, not symmetric about any local axis, rotated and scaled on the object
+#   rotated     the same bracket rotated inside the mesh, so the PCA box has to be built
+#   group       dense objects along a line, fitted with an empty hull cache (cold, every first run in a session),
+#                 again with the cached hulls (warm), and with PCA of all their world vertices put together
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+from unreal_collision import common, hull, obb
+
+def timed(f, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        f()
+    return (time.perf_counter() - start) / repeat
+
+def make_object(name, co, matrix):
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.update()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    obj.matrix_world = Matrix(matrix.tolist())
+    return obj
+
+def rotation_z(angle):
+    return np.array([[np.cos(angle), -np.sin(angle), 0.0], [np.sin(angle), np.cos(angle), 0.0], [0.0, 0.0, 1.0]])
+
+def make_bracket(n, rng):
+    co = np.vstack((rng.uniform(0.0, 1.0, (n // 2, 3)) * [4.0, 0.5, 1.0], rng.uniform(0.0, 1.0, (n - n // 2, 3)) * [0.5, 3.0, 1.0]))
+    co[:2] = [[0.0, 0.0, 0.0], [4.0, 3.0, 1.0]]
+    return co
+
+def main():
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    n = int(argv[0]) if len(argv) > 0 else 100000
+
+    rng = np.random.default_rng(0)
+    symmetric = rng.uniform(-1.0, 1.0, (n // 4, 3)) * [1.0, 2.0, 0.5]
+    symmetric = np.vstack([symmetric, symmetric * [-1.0, 1.0, 1.0], symmetric * [1.0, -1.0, 1.0], symmetric * [-1.0, -1.0, 1.0]])
+    bracket = make_bracket(n, rng)
+
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation_z(0.7) @ np.diag([1.0, 2.0, 3.0])
+    matrix[:3, 3] = [5.0, -2.0, 1.0]
+
+    for name, co in (("symmetric", symmetric), ("bracket", bracket), ("rotated", bracket @ rotation_z(0.5).T)):
+        obj = make_object(name, co, matrix)
+        fit = timed(lambda: obb.fit_obb([obj]), 10)
+        pca = timed(lambda: obb.find_obb_corners(common.get_world_verts(obj)), 10)
+        print("%-10s %8d verts  fit %8.4f s  pca %8.4f s" % (name, len(co), fit, pca))
+
+    count = int(argv[1]) if len(argv) > 1 else 500
+    objs = []
+    for i in range(count):
+        group_matrix = np.eye(4)
+        group_matrix[:3, :3] = rotation_z(rng.uniform(0.0, 0.3))
+        group_matrix[:3, 3] = [i * 0.1, i * 0.03, 0.0]
+        objs.append(make_object("group", rng.normal(size=(2000000 // count, 3)) * [1.0, 0.3, 0.2], group_matrix))
+
+    def cold():
+        hull._mesh_hull_cache.clear()
+        obb.fit_obb(objs)
+
+    cold_time = timed(cold, 3)
+    warm_time = timed(lambda: obb.fit_obb(objs), 3)
+    pca = timed(lambda: obb.find_obb_corners(np.concatenate([common.get_world_verts(obj) for obj in objs])), 3)
+    print("%-10s %8d objects  cold %8.4f s  warm %8.4f s  pca %8.4f s" % ("group", count, cold_time, warm_time, pca))
+
+if __name__ == "__main__":
+    main()
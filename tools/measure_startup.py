@@ -0,0 +1,59 @@
+
+# measure the cost of enabling collision add-ons, the same way Blender does at startup (import then register)
+
+# usage:
+#   blender --background --factory-startup --python tools/measure_startup.py -- <add-on> [<add-on> ...]
+#   each add-on is a single py file or a package folder
+#   run it once with the old single file add-ons (from a checkout before the package existed) and once with the
+#     unreal_collision folder to compare
+
+# output:
+#   one line per add-on with the import and register time and the heavy modules the add-on pulled in, then the total
+
+import importlib
+import os
+import sys
+import time
+
+HEAVY_MODULES = ("numpy", "bmesh", "mathutils")
+
+def measure(path):
+    path = os.path.abspath(path.rstrip("/\\"))
+    folder, name = os.path.split(path)
+    module_name = os.path.splitext(name)[0]
+
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+
+    before = set(sys.modules)
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    imported = time.perf_counter()
+    module.register()
+    registered = time.perf_counter()
+
+    loaded = sorted(m for m in set(sys.modules) - before if m.split('.')[0] in HEAVY_MODULES)
+
+    module.unregister()
+
+    return imported - start, registered - imported, loaded
+
+def main():
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    if len(argv) == 0:
+        print("usage: blender --background --factory-startup --python tools/measure_startup.py -- <add-on> [<add-on> ...]")
+        return
+
+    total = 0.0
+    for path in argv:
+        import_time, register_time, loaded = measure(path)
+        total += import_time + register_time
+        print("%-50s import %8.2f ms  register %8.2f ms  heavy modules: %s" % (
+            os.path.basename(path.rstrip("/\\")), import_time * 1000.0, register_time * 1000.0, ", ".join(loaded) if loaded else "none"))
+
+    print("%-50s %8.2f ms" % ("total", total * 1000.0))
+
+if __name__ == "__main__":
+    main()
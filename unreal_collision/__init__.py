@@ -0,0 +1,59 @@
+
+# install:
+#   zip the unreal_collision folder
+#   in Blender, Edit menu -> Preferences -> Install
+#   choose the zip file
+#   then enable the add-on in the list "Add Mesh: Unreal Collision"
+
+# typical usage:
+#   select objects, then shift+A to get the add menu, go to the Unreal Collision sub menu and choose one of the operators
+#   all operators are described in README.md
+
+# startup:
+#   only bpy is imported when the add-on is enabled, the fitting modules (and numpy, bmesh, mathutils) are imported the
+#     first time an operator runs
+#   tools/measure_startup.py measures the cost of enabling the add-on
+
+bl_info = {
+    "name": "Unreal Collision",
+    "author": "Bob Parkinson Jr.",
+    "version": (2,0),
+    "blender": (2, 80, 0),
+    "location": "View3D > Add > Unreal Collision",
+    "description": "Create, merge and export Unreal collision boxes and hulls for the selected objects",
+    "warning": "",
+    "wiki_url": "",
+    "tracker_url": "",
+    "category": "Add Mesh",
+}
+
+import bpy
+from . import operators
+
+class VIEW3D_MT_unreal_collision_add(bpy.types.Menu):
+    bl_idname = "VIEW3D_MT_unreal_collision_add"
+    bl_label = "Unreal Collision"
+
+    def draw(self, context):
+        layout = self.layout
+        for cls in operators.add_classes:
+            layout.operator(cls.bl_idname, text=cls.bl_label, icon="PLUGIN")
+        layout.separator()
+        layout.operator(operators.MergeUBX.bl_idname, text=operators.MergeUBX.bl_label, icon="PLUGIN")
+        layout.operator(operators.AuditCollision.bl_idname, text=operators.AuditCollision.bl_label, icon="PLUGIN")
+        layout.operator(operators.ExportCollisionFBX.bl_idname, text=operators.ExportCollisionFBX.bl_label, icon="PLUGIN")
+
+def menu_unreal_collision(self, context):
+    self.layout.menu(VIEW3D_MT_unreal_collision_add.bl_idname, icon="PLUGIN")
+
+def register():
+    for cls in operators.classes:
+        bpy.utils.register_class(cls)
+    bpy.utils.register_class(VIEW3D_MT_unreal_collision_add)
+    bpy.types.VIEW3D_MT_add.append(menu_unreal_collision)
+
+def unregister():
+    bpy.types.VIEW3D_MT_add.remove(menu_unreal_collision)
+    bpy.utils.unregister_class(VIEW3D_MT_unreal_collision_add)
+    for cls in reversed(operators.classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,13 @@
+
+# axis-aligned box fitting
+
+from .common import BOX_SIGNS, get_world_bounds
+
+def fit_aabb(objs):
+    # returns the box corners relative to the box center and the center in world space
+    co_min, co_max = get_world_bounds(objs)
+
+    half = (co_max - co_min) * 0.5
+    center = co_min + half
+
+    return BOX_SIGNS * half, center
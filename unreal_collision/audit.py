@@ -0,0 +1,182 @@
+
+# whole scene audit of collision coverage and cost
+
+# every mesh object is matched to its collision by the naming convention: the asset name is the object name up to the first '.',
+#   the collision lives in the "Collision_" + asset collection and is named "UBX_" (boxes) or "UCX_" (convex hulls) + asset + "_" + number
+# all bounds tests run on arrays of world space bounding boxes built in one pass over the scene
+
+import bpy
+import csv
+import json
+import numpy as np
+from .common import get_base_name
+
+COLLISION_PREFIXES = ("UBX_", "UCX_")
+COLLECTION_PREFIX = "Collision_"
+
+REPORT_FIELDS = ("asset", "status", "source_objects", "boxes", "hulls", "primitives", "stale", "oversized")
+
+def get_collision_base_name(name):
+    # "UBX_Crate_3" -> "Crate"
+    name = get_base_name(name)[4:]
+    underscore_index = name.rfind('_')
+    if underscore_index >= 0 and name[underscore_index + 1:].isdigit():
+        name = name[0:underscore_index]
+    return name
+
+def get_object_arrays(objs):
+    # world matrices and local bound boxes of all objects
+    n = len(objs)
+    matrices = np.empty(n * 16, dtype=np.float32)
+    bounds = np.empty(n * 24, dtype=np.float32)
+    try:
+        objs.foreach_get("matrix_world", matrices)
+        objs.foreach_get("bound_box", bounds)
+        # matrices come out column major
+        matrices = matrices.reshape(n, 4, 4).transpose(0, 2, 1)
+    except (AttributeError, TypeError, RuntimeError):
+        matrices = np.array([np.array(obj.matrix_world) for obj in objs], dtype=np.float32).reshape(n, 4, 4)
+        bounds = np.array([np.array(obj.bound_box) for obj in objs], dtype=np.float32)
+
+    return matrices.astype(np.float64), bounds.reshape(n, 8, 3).astype(np.float64)
+
+def get_world_aabbs(matrices, bounds):
+    corners = np.einsum('nij,nkj->nki', matrices[:, :3, :3], bounds) + matrices[:, None, :3, 3]
+    return np.min(corners, axis=1), np.max(corners, axis=1)
+
+def audit_scene(scene, oversize_ratio=4.0, tolerance=0.01):
+    # returns one report row per asset, sorted by asset name
+    objs = scene.objects
+    names = [obj.name for obj in objs]
+    types = [obj.type for obj in objs]
+
+    # collision objects found through their collection first, then through their name
+    collection_base = {}
+    for coll in bpy.data.collections:
+        if coll.name.startswith(COLLECTION_PREFIX):
+            base = get_base_name(coll.name[len(COLLECTION_PREFIX):])
+            for obj in coll.objects:
+                collection_base[obj.name] = base
+
+    assets = {}
+    asset_index = np.empty(len(names), dtype=np.int64)
+    is_box = np.zeros(len(names), dtype=bool)
+    is_hull = np.zeros(len(names), dtype=bool)
+    is_source = np.zeros(len(names), dtype=bool)
+    for i, (name, obj_type) in enumerate(zip(names, types)):
+        if obj_type != 'MESH':
+            asset_index[i] = -1
+            continue
+
+        if name.startswith(COLLISION_PREFIXES):
+            base = collection_base.get(name)
+            if base is None:
+                base = get_collision_base_name(name)
+            is_box[i] = name.startswith("UBX_")
+            is_hull[i] = not is_box[i]
+        elif name in collection_base:
+            # something else parked in a collision collection, not an asset of its own
+            asset_index[i] = -1
+            continue
+        else:
+            base = get_base_name(name)
+            is_source[i] = True
+
+        asset_index[i] = assets.setdefault(base, len(assets))
+
+    asset_names = sorted(assets, key=assets.get)
+    n_assets = len(asset_names)
+
+    matrices, bounds = get_object_arrays(objs)
+    lo, hi = get_world_aabbs(matrices, bounds)
+
+    source_count = np.bincount(asset_index[is_source], minlength=n_assets)
+    box_count = np.bincount(asset_index[is_box], minlength=n_assets)
+    hull_count = np.bincount(asset_index[is_hull], minlength=n_assets)
+
+    # world bounds of the cosmetic geometry and of the collision of every asset
+    source_lo = np.full((n_assets, 3), np.inf)
+    source_hi = np.full((n_assets, 3), -np.inf)
+    np.minimum.at(source_lo, asset_index[is_source], lo[is_source])
+    np.maximum.at(source_hi, asset_index[is_source], hi[is_source])
+
+    collision = is_box | is_hull
+    collision_lo = np.full((n_assets, 3), np.inf)
+    collision_hi = np.full((n_assets, 3), -np.inf)
+    np.minimum.at(collision_lo, asset_index[collision], lo[collision])
+    np.maximum.at(collision_hi, asset_index[collision], hi[collision])
+
+    # collision that doesn't touch its asset is stale, collision much bigger than its asset is oversized
+    has_source = source_count > 0
+    ci = np.nonzero(collision)[0]
+    ai = asset_index[ci]
+    size = np.max(source_hi[ai] - source_lo[ai], axis=1, initial=0.0)
+    slack = (size * tolerance)[:, None]
+    touches = np.all((lo[ci] <= source_hi[ai] + slack) & (hi[ci] >= source_lo[ai] - slack), axis=1)
+    stale = has_source[ai] & ~touches
+
+    source_volume = np.prod(np.clip(source_hi[ai] - source_lo[ai], 0.0, None), axis=1)
+    box_volume = np.prod(hi[ci] - lo[ci], axis=1)
+    oversized = has_source[ai] & touches & (box_volume > source_volume * oversize_ratio)
+
+    # the collision of an asset has to reach every side of the asset
+    asset_size = np.max(source_hi - source_lo, axis=1, initial=0.0)
+    asset_slack = (asset_size * tolerance)[:, None]
+    covered = np.all((collision_lo <= source_lo + asset_slack) & (collision_hi >= source_hi - asset_slack), axis=1)
+
+    stale_names = [[] for _ in range(n_assets)]
+    oversized_names = [[] for _ in range(n_assets)]
+    for k in np.nonzero(stale)[0]:
+        stale_names[ai[k]].append(names[ci[k]])
+    for k in np.nonzero(oversized)[0]:
+        oversized_names[ai[k]].append(names[ci[k]])
+
+    rows = []
+    for a, asset in enumerate(asset_names):
+        primitives = int(box_count[a] + hull_count[a])
+        if source_count[a] == 0:
+            status = "orphan"
+        elif primitives == 0:
+            status = "missing"
+        elif len(stale_names[a]) > 0:
+            status = "stale"
+        elif not covered[a] or len(oversized_names[a]) > 0:
+            status = "misfit"
+        else:
+            status = "ok"
+
+        rows.append({
+            "asset": asset,
+            "status": status,
+            "source_objects": int(source_count[a]),
+            "boxes": int(box_count[a]),
+            "hulls": int(hull_count[a]),
+            "primitives": primitives,
+            "stale": sorted(stale_names[a]),
+            "oversized": sorted(oversized_names[a]),
+        })
+
+    rows.sort(key=lambda row: row["asset"])
+    return rows
+
+def get_summary(rows):
+    summary = {"assets": len(rows), "primitives": sum(row["primitives"] for row in rows)}
+    for status in ("ok", "missing", "stale", "misfit", "orphan"):
+        summary[status] = sum(1 for row in rows if row["status"] == status)
+    return summary
+
+def write_report(rows, filepath):
+    # json when the file ends with .json, csv otherwise
+    if filepath.lower().endswith(".json"):
+        with open(filepath, "w") as f:
+            json.dump({"summary": get_summary(rows), "assets": rows}, f, indent=2)
+        return
+
+    with open(filepath, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            row = dict(row)
+            row["stale"] = ";".join(row["stale"])
+            row["oversized"] = ";".join(row["oversized"])
+            writer.writerow(row)
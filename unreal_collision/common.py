@@ -0,0 +1,119 @@
+
+# helpers shared by all the collision operators: naming, collections, vertex access and creating the collision object
+# this module is only imported when an operator runs, keep it out of the add-on's register path
+
+import bpy
+import bmesh
+from bpy_extras import object_utils
+import numpy as np
+
+# corner signs in the order the box vertices are created, matches get_box_faces
+BOX_SIGNS = np.array([
+    [+1.0, +1.0, -1.0],
+    [+1.0, -1.0, -1.0],
+    [-1.0, -1.0, -1.0],
+    [-1.0, +1.0, -1.0],
+    [+1.0, +1.0, +1.0],
+    [+1.0, -1.0, +1.0],
+    [-1.0, -1.0, +1.0],
+    [-1.0, +1.0, +1.0],
+])
+
+def get_box_faces():
+    return [(0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (4, 0, 3, 7),]
+
+def get_base_name(name):
+    dot_index = name.find('.')
+    if dot_index >= 0:
+        return name[0:dot_index]
+    return name
+
+def get_mesh_name(context, prefix, base_name):
+    mesh_base_name = prefix + base_name
+    mesh_name = mesh_base_name + "_0"
+    counter = 0
+    while context.scene.objects.get(mesh_name):
+        mesh_name = mesh_base_name + "_" + str(counter)
+        counter = counter + 1
+    return mesh_name
+
+def update_collection(context, name):
+    scene = context.scene
+
+    coll = bpy.data.collections.get(name)
+
+    # if it doesn't exist create it
+    if coll is None:
+        coll = bpy.data.collections.new(name)
+
+    # if it is not linked to scene colleciton treelink it
+    if not scene.user_of_id(coll):
+        context.collection.children.link(coll)
+
+    return coll
+
+def get_local_verts(obj):
+    mesh = obj.data
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3).astype(np.float64)
+
+def get_world_verts(obj):
+    mat = np.array(obj.matrix_world)
+    return get_local_verts(obj) @ mat[:3, :3].T + mat[:3, 3]
+
+def get_world_bounds(objs):
+    # world space min and max of the bound boxes of objs
+    corners = []
+    for obj in objs:
+        mat = np.array(obj.matrix_world)
+        corners.append(np.array(obj.bound_box) @ mat[:3, :3].T + mat[:3, 3])
+
+    corners = np.concatenate(corners)
+    return np.min(corners, axis=0), np.max(corners, axis=0)
+
+def new_box_bmesh(corners):
+    bm = bmesh.new()
+    for v_co in corners:
+        bm.verts.new(v_co)
+
+    bm.verts.ensure_lookup_table()
+
+    for f_idx in get_box_faces():
+        bm.faces.new([bm.verts[i] for i in f_idx])
+
+    return bm
+
+def add_collision_object(operator, context, prefix, base_name, default_name, bm, location):
+    # bm holds the collision geometry relative to location, it is freed here
+    coll = None
+    if base_name == "":
+        mesh_name = default_name
+    else:
+        coll = update_collection(context, "Collision_" + base_name)
+        mesh_name = get_mesh_name(context, prefix, base_name)
+
+    mesh = bpy.data.meshes.new(mesh_name)
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+    operator.location[0] = location[0]
+    operator.location[1] = location[1]
+    operator.location[2] = location[2]
+
+    obj = object_utils.object_data_add(context, mesh, operator=operator)
+    obj.display_type = 'WIRE'
+    obj.hide_render = True
+
+    if coll != None:
+        try:
+            context.scene.collection.objects.unlink(obj)
+        except:
+            pass
+        try:
+            coll.objects.link(obj)
+        except:
+            pass
+
+    return obj
@@ -0,0 +1,175 @@
+
+# batched per asset fbx export of cosmetic and collision geometry
+
+# every "Collision_" + asset collection pairs the asset (the mesh objects named asset or asset.###) with its collision objects
+# the exports run in background Blender processes on a copy of the file, so the selection in the open file never changes
+# a manifest in the export folder keeps the geometry and collision hashes of every exported asset, unchanged assets are skipped
+#   the hashes cover the evaluated meshes (modifiers applied, like the export), their uvs and the material slots
+
+import bpy
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import numpy as np
+from .audit import COLLECTION_PREFIX, COLLISION_PREFIXES
+from .common import get_base_name
+
+MANIFEST_NAME = "unreal_collision_export.json"
+
+def find_export_assets(scene):
+    # returns {asset: (cosmetic object names, collision object names)} for every asset with collision
+    collision = {}
+    for coll in bpy.data.collections:
+        if not coll.name.startswith(COLLECTION_PREFIX):
+            continue
+        base = get_base_name(coll.name[len(COLLECTION_PREFIX):])
+        names = [obj.name for obj in coll.objects if obj.type == 'MESH' and obj.name.startswith(COLLISION_PREFIXES) and scene.objects.get(obj.name)]
+        if len(names) > 0:
+            collision.setdefault(base, []).extend(names)
+
+    cosmetic = {}
+    for obj in scene.objects:
+        if obj.type != 'MESH' or obj.name.startswith(COLLISION_PREFIXES):
+            continue
+        base = get_base_name(obj.name)
+        if base in collision:
+            cosmetic.setdefault(base, []).append(obj.name)
+
+    return {base: (sorted(cosmetic[base]), sorted(collision[base])) for base in collision if base in cosmetic}
+
+def get_objects_hash(objs, depsgraph):
+    # hash of what the fbx export writes for the objects: the transform, the material slots and the evaluated mesh (modifiers
+    #   applied) with its vertex positions, faces, material indices and uvs
+    #   edits inside a material (node or color changes) don't change the hash, use force to export them
+    h = hashlib.blake2b(digest_size=16)
+    for obj in objs:
+        h.update(obj.name.encode())
+        h.update(np.array(obj.matrix_world, dtype=np.float32).tobytes())
+
+        for slot in obj.material_slots:
+            h.update(slot.link.encode())
+            h.update(slot.material.name_full.encode() if slot.material is not None else b"\0")
+
+        eval_obj = obj.evaluated_get(depsgraph)
+        mesh = eval_obj.to_mesh()
+        try:
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            h.update(co.tobytes())
+
+            loops = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", loops)
+            h.update(loops.tobytes())
+
+            for attr in ("loop_total", "material_index"):
+                values = np.empty(len(mesh.polygons), dtype=np.int32)
+                mesh.polygons.foreach_get(attr, values)
+                h.update(values.tobytes())
+
+            for layer in mesh.uv_layers:
+                h.update(layer.name.encode())
+                uv = np.empty(len(layer.data) * 2, dtype=np.float32)
+                layer.data.foreach_get("uv", uv)
+                h.update(uv.tobytes())
+        finally:
+            eval_obj.to_mesh_clear()
+
+    return h.hexdigest()
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_manifest(directory, manifest):
+    with open(os.path.join(directory, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+def run_workers(blend_path, jobs, workers, temp_dir):
+    # splits the jobs over the worker processes, returns {asset: error or None}
+    worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "export_worker.py")
+
+    processes = []
+    for i in range(workers):
+        chunk = jobs[i::workers]
+        if len(chunk) == 0:
+            continue
+
+        job_path = os.path.join(temp_dir, "jobs_%d.json" % i)
+        result_path = os.path.join(temp_dir, "results_%d.json" % i)
+        with open(job_path, "w") as f:
+            json.dump(chunk, f)
+
+        args = [bpy.app.binary_path, "--background", "--factory-startup", blend_path,
+                "--python", worker_script, "--", job_path, result_path]
+        processes.append((subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL), chunk, result_path))
+
+    results = {}
+    for process, chunk, result_path in processes:
+        process.wait()
+        try:
+            with open(result_path) as f:
+                results.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+        for job in chunk:
+            if job["asset"] not in results:
+                results[job["asset"]] = "worker exited with code %d" % process.returncode
+
+    return results
+
+def export_assets(context, directory, workers, force=False):
+    # returns the number of exported, skipped and failed assets and the error messages
+    scene = context.scene
+    os.makedirs(directory, exist_ok=True)
+
+    manifest = read_manifest(directory)
+    depsgraph = context.evaluated_depsgraph_get()
+
+    jobs = []
+    hashes = {}
+    skipped = 0
+    for asset, (cosmetic, collision) in sorted(find_export_assets(scene).items()):
+        geometry_hash = get_objects_hash([scene.objects[name] for name in cosmetic], depsgraph)
+        collision_hash = get_objects_hash([scene.objects[name] for name in collision], depsgraph)
+        filepath = os.path.join(directory, bpy.path.clean_name(asset) + ".fbx")
+
+        entry = manifest.get(asset)
+        if not force and entry is not None and os.path.exists(filepath) and \
+                entry.get("geometry") == geometry_hash and entry.get("collision") == collision_hash:
+            skipped += 1
+            continue
+
+        hashes[asset] = {"geometry": geometry_hash, "collision": collision_hash, "file": os.path.basename(filepath)}
+        jobs.append({"asset": asset, "objects": cosmetic + collision, "filepath": filepath})
+
+    if len(jobs) == 0:
+        return 0, skipped, 0, []
+
+    temp_dir = tempfile.mkdtemp(prefix="unreal_collision_export_")
+    try:
+        # the workers read a copy of the current state, the open file keeps its path and unsaved changes
+        blend_path = os.path.join(temp_dir, "export.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True)
+
+        results = run_workers(blend_path, jobs, max(1, min(workers, len(jobs))), temp_dir)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    errors = []
+    for job in jobs:
+        error = results.get(job["asset"])
+        if error is None:
+            manifest[job["asset"]] = hashes[job["asset"]]
+        else:
+            errors.append("%s: %s" % (job["asset"], error))
+
+    write_manifest(directory, manifest)
+
+    return len(jobs) - len(errors), skipped, len(errors), errors
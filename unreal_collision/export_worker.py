@@ -0,0 +1,79 @@
+
+# background side of the batched fbx export, started by export.py, not part of the add-on
+
+# usage:
+#   blender --background --factory-startup <copy of the file> --python export_worker.py -- <jobs.json> <results.json>
+#   every job is {"asset": name, "objects": [object names], "filepath": fbx path}
+#   results.json gets {asset: null} for every exported asset and {asset: error message} for the rest
+
+import json
+import sys
+
+import bpy
+
+def find_layer_collections(layer_coll, colls, path, found):
+    # every layer collection on the way down to one of colls, parents before their children
+    for child in layer_coll.children:
+        path.append(child)
+        if child.collection in colls:
+            found.extend(layer for layer in path if layer not in found)
+        find_layer_collections(child, colls, path, found)
+        path.pop()
+
+def show_objects(view_layer, objs):
+    # the exporter only takes the selected objects, and only visible and selectable objects can be selected
+    #   hidden, excluded or unselectable collections (the "Collision_" collections usually are) are shown, this only changes the copy of the file
+    colls = set()
+    for obj in objs:
+        colls.update(obj.users_collection)
+
+    found = []
+    find_layer_collections(view_layer.layer_collection, colls, [], found)
+    for layer in found:
+        layer.exclude = False
+        layer.hide_viewport = False
+        layer.collection.hide_viewport = False
+        layer.collection.hide_select = False
+
+    for obj in objs:
+        obj.hide_viewport = False
+        obj.hide_select = False
+        obj.hide_set(False)
+
+def export_job(view_layer, job):
+    for obj in view_layer.objects:
+        obj.select_set(False)
+
+    objs = [bpy.data.objects[name] for name in job["objects"]]
+    show_objects(view_layer, objs)
+    for obj in objs:
+        obj.select_set(True)
+
+    # an object left out of the selection would be missing from the file without any error
+    missing = set(job["objects"]) - set(obj.name for obj in bpy.context.selected_objects)
+    if len(missing) > 0:
+        raise RuntimeError("can't select " + ", ".join(sorted(missing)))
+
+    bpy.ops.export_scene.fbx(filepath=job["filepath"], use_selection=True, object_types={'MESH'})
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:]
+    job_path, result_path = argv[0], argv[1]
+
+    with open(job_path) as f:
+        jobs = json.load(f)
+
+    view_layer = bpy.context.view_layer
+    results = {}
+    for job in jobs:
+        try:
+            export_job(view_layer, job)
+            results[job["asset"]] = None
+        except Exception as e:
+            results[job["asset"]] = str(e)
+
+    with open(result_path, "w") as f:
+        json.dump(results, f)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+
+# convex hull of a point set, used as a lower bound for the volume of any box or hull around the points
+#   and as the outer shell of a group of objects
+
+import bpy
+import bmesh
+import hashlib
+import numpy as np
+from .common import get_local_verts
+from .kdop import get_kdop_directions
+
+def find_hull(points):
+    # returns the hull vertices and the hull volume
+    # the points go through a temporary mesh so large point sets aren't added to the bmesh one at a time
+    mesh = bpy.data.meshes.new("UCX_HULL_TEMP")
+    mesh.vertices.add(len(points))
+    mesh.vertices.foreach_set("co", np.asarray(points, dtype=np.float32).ravel())
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bpy.data.meshes.remove(mesh)
+
+    ret = bmesh.ops.convex_hull(bm, input=bm.verts)
+    bmesh.ops.delete(bm, geom=ret["geom_interior"] + ret["geom_unused"], context='VERTS')
+
+    verts = np.array([v.co[:] for v in bm.verts], dtype=np.float64).reshape(-1, 3)
+    volume = bm.calc_volume(signed=False) if len(bm.faces) > 0 else 0.0
+    bm.free()
+
+    return verts, volume
+
+# hulls of object meshes in local space, keyed by mesh name and checked against a hash of the vertex positions
+#   at most MESH_HULL_CACHE_SIZE hulls are kept, when it is full the hulls of deleted or renamed meshes go first, then the least recently used
+MESH_HULL_CACHE_SIZE = 4096
+_mesh_hull_cache = {}
+
+def get_mesh_key(co):
+    return hashlib.blake2b(co.tobytes(), digest_size=16).digest()
+
+def find_cached_hull(name, key):
+    cached = _mesh_hull_cache.get(name)
+    if cached is None or cached[0] != key:
+        return None
+
+    # most recently used last
+    _mesh_hull_cache[name] = _mesh_hull_cache.pop(name)
+    return cached[1], cached[2]
+
+def get_cached_mesh_hull(obj, co):
+    # returns the cached hull of the object's mesh with local vertices co, or None when the mesh was never hulled or changed since
+    return find_cached_hull(obj.data.name_full, get_mesh_key(co))
+
+def store_mesh_hull(name, key, verts, volume):
+    _mesh_hull_cache.pop(name, None)
+    if len(_mesh_hull_cache) >= MESH_HULL_CACHE_SIZE:
+        names = set(mesh.name_full for mesh in bpy.data.meshes)
+        for stale in [stale for stale in _mesh_hull_cache if stale not in names]:
+            del _mesh_hull_cache[stale]
+        while len(_mesh_hull_cache) >= MESH_HULL_CACHE_SIZE:
+            del _mesh_hull_cache[next(iter(_mesh_hull_cache))]
+
+    _mesh_hull_cache[name] = (key, verts, volume)
+
+def find_extreme_points(co):
+    # the vertices furthest out along the 26-DOP directions, every one of them is a vertex of the hull
+    proj = co @ get_kdop_directions('DOP26').T
+    return co[np.unique(np.concatenate((np.argmin(proj, axis=0), np.argmax(proj, axis=0))))]
+
+def get_mesh_hull(obj, co=None):
+    # returns the local space hull vertices and hull volume of the extreme vertices of the object's mesh, computed once per mesh state
+    #   the hull is built from at most 26 points however dense the mesh is, it lies inside the hull of the whole mesh
+    #   so its volume still bounds every box around the mesh from below, but its vertices don't bound the mesh
+    if co is None:
+        co = get_local_verts(obj)
+    key = get_mesh_key(co)
+    hull = find_cached_hull(obj.data.name_full, key)
+    if hull is not None:
+        return hull
+
+    points = find_extreme_points(co)
+    verts, volume = find_hull(points)
+    if len(verts) < 4:
+        # flat or degenerate mesh, the points are their own hull
+        verts = points
+
+    store_mesh_hull(obj.data.name_full, key, verts, volume)
+    return verts, volume
+
+def merge_hulls(point_sets):
+    # pairwise reduction, every level replaces two neighbouring point sets with the hull of both
+    #   so no hull is ever built from more points than two hulls
+    point_sets = list(point_sets)
+    while len(point_sets) > 1:
+        merged = []
+        for i in range(0, len(point_sets) - 1, 2):
+            points = np.concatenate((point_sets[i], point_sets[i + 1]))
+            verts = find_hull(points)[0]
+            merged.append(verts if len(verts) >= 4 else points)
+        if len(point_sets) % 2 == 1:
+            merged.append(point_sets[-1])
+        point_sets = merged
+
+    return point_sets[0]
@@ -0,0 +1,89 @@
+
+# k-DOP fitting, 10-DOP (X, Y or Z), 18-DOP and 26-DOP
+
+import bmesh
+import itertools
+import numpy as np
+from .common import get_world_verts
+
+def get_kdop_directions(kdop_type):
+    axes = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]
+
+    if kdop_type == 'DOP10_X':
+        dirs = axes + [(0.0, 1.0, 1.0), (0.0, 1.0, -1.0)]
+    elif kdop_type == 'DOP10_Y':
+        dirs = axes + [(1.0, 0.0, 1.0), (1.0, 0.0, -1.0)]
+    elif kdop_type == 'DOP10_Z':
+        dirs = axes + [(1.0, 1.0, 0.0), (1.0, -1.0, 0.0)]
+    else:
+        dirs = axes + [(1.0, 1.0, 0.0), (1.0, -1.0, 0.0),
+                       (1.0, 0.0, 1.0), (1.0, 0.0, -1.0),
+                       (0.0, 1.0, 1.0), (0.0, 1.0, -1.0)]
+        if kdop_type == 'DOP26':
+            dirs = dirs + [(1.0, 1.0, 1.0), (1.0, 1.0, -1.0),
+                           (1.0, -1.0, 1.0), (-1.0, 1.0, 1.0)]
+
+    dirs = np.array(dirs)
+    return dirs / np.linalg.norm(dirs, axis=1)[:, None]
+
+def find_kdop_corners(points, dirs):
+    # a single projection of every point onto every direction gives the slab for each direction
+    proj = points @ dirs.T
+    dmin = np.min(proj, axis=0)
+    dmax = np.max(proj, axis=0)
+
+    # flat input would give a polytope without volume, keep every slab a little thick
+    extent = max(float(np.max(dmax - dmin)), 1e-6)
+    min_thickness = extent * 1e-4
+    pad = np.maximum(min_thickness - (dmax - dmin), 0.0) * 0.5
+    dmin = dmin - pad
+    dmax = dmax + pad
+
+    # half spaces n . x <= d
+    normals = np.vstack((dirs, -dirs))
+    offsets = np.concatenate((dmax, -dmin))
+
+    # the polytope corners are the intersections of plane triples that lie inside every half space
+    triples = np.array(list(itertools.combinations(range(len(normals)), 3)))
+    a = normals[triples]
+    b = offsets[triples]
+
+    valid = np.abs(np.linalg.det(a)) > 1e-9
+    a = a[valid]
+    b = b[valid]
+
+    corners = np.linalg.solve(a, b[:, :, None])[:, :, 0]
+
+    eps = extent * 1e-6
+    inside = np.all(corners @ normals.T <= offsets + eps, axis=1)
+    corners = corners[inside]
+
+    # several triples meet at the same corner
+    keys = np.round(corners / eps).astype(np.int64)
+    _, unique_index = np.unique(keys, axis=0, return_index=True)
+
+    return corners[np.sort(unique_index)]
+
+def new_kdop_bmesh(corners):
+    bm = bmesh.new()
+    for v_co in corners:
+        bm.verts.new(v_co)
+
+    ret = bmesh.ops.convex_hull(bm, input=bm.verts)
+    bmesh.ops.delete(bm, geom=ret["geom_interior"] + ret["geom_unused"], context='VERTS')
+
+    # the hull comes back triangulated, merge the triangles back into the k-DOP faces
+    bmesh.ops.dissolve_limit(bm, angle_limit=0.0001, verts=bm.verts[:], edges=bm.edges[:])
+
+    return bm
+
+def fit_kdop(objs, kdop_type):
+    # returns the polytope corners relative to its center and the center in world space
+    points = np.concatenate([get_world_verts(obj) for obj in objs])
+    corners = find_kdop_corners(points, get_kdop_directions(kdop_type))
+
+    co_min = np.min(corners, axis=0)
+    co_max = np.max(corners, axis=0)
+    center = co_min + ((co_max - co_min) / 2)
+
+    return corners - center, center
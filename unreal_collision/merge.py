@@ -0,0 +1,368 @@
+
+# redundant and overlapping UBX_ box cleanup
+
+import bpy
+import itertools
+import numpy as np
+from .common import BOX_SIGNS
+
+def get_world_corners(obj):
+    mesh = obj.data
+    if len(mesh.vertices) != 8:
+        return None
+
+    co = np.empty(24, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(8, 3).astype(np.float64)
+
+    mat = np.array(obj.matrix_world)
+    return co @ mat[:3, :3].T + mat[:3, 3]
+
+def find_box_frame(corners, tolerance):
+    # returns center, axes (rows) and half extents of the box through the 8 corners, or None if they are not a box
+    origin = corners[0]
+    edges = None
+    for i, j, k in itertools.combinations(range(1, 8), 3):
+        a = corners[i] - origin
+        b = corners[j] - origin
+        c = corners[k] - origin
+        la, lb, lc = np.linalg.norm(a), np.linalg.norm(b), np.linalg.norm(c)
+        if min(la, lb, lc) <= 0.0:
+            continue
+        if abs(a @ b) > tolerance * la * lb or abs(a @ c) > tolerance * la * lc or abs(b @ c) > tolerance * lb * lc:
+            continue
+        if np.linalg.norm(origin + a + b + c - corners, axis=1).min() > tolerance * (la + lb + lc):
+            continue
+        edges = np.array([a, b, c])
+        break
+
+    if edges is None:
+        return None
+
+    lengths = np.linalg.norm(edges, axis=1)
+    axes = edges / lengths[:, None]
+    center = origin + np.sum(edges, axis=0) * 0.5
+    half = lengths * 0.5
+
+    # every corner has to sit on the box built from the frame
+    local = (corners - center) @ axes.T
+    if np.max(np.abs(np.abs(local) - half)) > tolerance * np.max(lengths):
+        return None
+
+    return center, axes, half
+
+def find_boxes(objs, tolerance):
+    # gather every box in one set of arrays, boxes made by the add-ons take the fast path through the known vertex order
+    boxes = []
+    corners = []
+    for obj in objs:
+        co = get_world_corners(obj)
+        if co is not None:
+            boxes.append(obj)
+            corners.append(co)
+
+    if len(boxes) == 0:
+        return [], None, None, None, None
+
+    corners = np.array(corners)
+    n = len(boxes)
+
+    edges = np.stack((corners[:, 0] - corners[:, 3], corners[:, 0] - corners[:, 1], corners[:, 4] - corners[:, 0]), axis=1)
+    lengths = np.linalg.norm(edges, axis=2)
+    safe_lengths = np.where(lengths > 0.0, lengths, 1.0)
+    axes = edges / safe_lengths[:, :, None]
+    half = lengths * 0.5
+    center = np.mean(corners, axis=1)
+
+    rebuilt = center[:, None, :] + np.einsum('kj,nj,nji->nki', BOX_SIGNS, half, axes)
+    scale = np.max(lengths, axis=1)
+    err = np.max(np.linalg.norm(rebuilt - corners, axis=2), axis=1)
+    ortho = np.abs(np.einsum('nij,nkj->nik', axes, axes) - np.eye(3)).max(axis=(1, 2))
+    ok = (np.min(lengths, axis=1) > 0.0) & (err <= tolerance * scale) & (ortho <= tolerance)
+
+    valid = np.ones(n, dtype=bool)
+    for i in np.nonzero(~ok)[0]:
+        frame = find_box_frame(corners[i], tolerance)
+        if frame is None:
+            valid[i] = False
+        else:
+            center[i], axes[i], half[i] = frame
+
+    # remember which corner each vertex is so the box can be written back in its own vertex order
+    local = np.einsum('nkj,nij->nki', corners - center[:, None, :], axes)
+    signs = np.where(local >= 0.0, 1.0, -1.0)
+
+    keep = np.nonzero(valid)[0]
+    boxes = [boxes[i] for i in keep]
+    return boxes, center[keep], axes[keep], half[keep], signs[keep]
+
+def iter_candidate_pairs(lo, hi, chunk_size, skip=None):
+    # sweep and prune along x, then reject the pairs that don't overlap in y and z
+    # yields the pairs in chunks of about chunk_size, all pairs of one box in the sweep order stay in one chunk
+    # skip is read again for every chunk, boxes set in it while the chunks are handled drop out of the following chunks
+    n = len(lo)
+    order = np.argsort(lo[:, 0], kind='stable')
+    lo_s = lo[order]
+    hi_s = hi[order]
+
+    end = np.searchsorted(lo_s[:, 0], hi_s[:, 0], side='right')
+    counts = np.maximum(end - np.arange(1, n + 1), 0)
+    cum = np.cumsum(counts)
+
+    row = 0
+    while row < n:
+        done = cum[row] - counts[row]
+        row_end = max(int(np.searchsorted(cum, done + chunk_size, side='right')), row + 1)
+        row_end = min(row_end, n)
+
+        chunk_counts = counts[row:row_end]
+        if skip is not None:
+            chunk_counts = np.where(skip[order[row:row_end]], 0, chunk_counts)
+        total = int(np.sum(chunk_counts))
+        if total > 0:
+            ia = np.repeat(np.arange(row, row_end), chunk_counts)
+            starts = np.cumsum(chunk_counts) - chunk_counts
+            ib = ia + 1 + (np.arange(total) - np.repeat(starts, chunk_counts))
+
+            overlap = np.all((lo_s[ia, 1:] <= hi_s[ib, 1:]) & (lo_s[ib, 1:] <= hi_s[ia, 1:]), axis=1)
+            if skip is not None:
+                overlap &= ~skip[order[ib]]
+            if np.any(overlap):
+                yield order[ia[overlap]], order[ib[overlap]]
+
+        row = row_end
+
+def iter_partner_pairs(lo, hi, boxes, chunk_size, skip=None):
+    # pairs of every box in boxes with each box its bounds overlap, tested directly instead of through a sweep
+    #   for the few boxes that changed since the last pass, pairs of two such boxes are only yielded once
+    listed = np.zeros(len(lo), dtype=bool)
+    listed[boxes] = True
+    step = max(1, chunk_size // max(len(lo), 1))
+    for first in range(0, len(boxes), step):
+        rows = boxes[first:first + step]
+        if skip is not None:
+            rows = rows[~skip[rows]]
+        if len(rows) == 0:
+            continue
+
+        overlap = np.all((lo[rows][:, None, :] <= hi[None, :, :]) & (lo[None, :, :] <= hi[rows][:, None, :]), axis=2)
+        overlap &= ~(listed[None, :] & (np.arange(len(lo))[None, :] <= rows[:, None]))
+        if skip is not None:
+            overlap &= ~skip[None, :]
+
+        ia, ib = np.nonzero(overlap)
+        if len(ia) > 0:
+            yield rows[ia], ib
+
+def find_duplicate_boxes(center, axes, half, tolerance):
+    # boxes with the same center, axes and extents up to the tolerance, all but the first of each group
+    # every box is rounded on a grid scaled to its own size (the power of two above its largest half extent), so small boxes
+    #   next to a large one keep their own cells, the boxes grouped by the rounding are compared exactly before one is dropped
+    size = np.max(half, axis=1)
+    level = np.ceil(np.log2(np.maximum(size, 1e-12)))
+    scale = (np.exp2(level) * max(tolerance, 1e-12))[:, None]
+    keys = np.concatenate((
+        level[:, None],
+        np.round(center / scale),
+        np.round(axes.reshape(-1, 9) / max(tolerance, 1e-12)),
+        np.round(half / scale),
+    ), axis=1).astype(np.int64)
+
+    _, first, group = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    group = group.reshape(-1)
+    first = first[group]
+
+    tol = tolerance * np.maximum(size, size[first])
+    same = (np.max(np.abs(center - center[first]), axis=1) <= tol) & \
+           (np.max(np.abs(half - half[first]), axis=1) <= tol) & \
+           (np.max(np.abs(axes - axes[first]), axis=(1, 2)) <= tolerance)
+    return same & (first != np.arange(len(center)))
+
+def merge_boxes(center, axes, half, overlap_threshold, tolerance, max_passes=16, chunk_size=65536):
+    # returns the removed mask and the modified mask, center and half are updated in place
+    removed = find_duplicate_boxes(center, axes, half, tolerance)
+    modified = np.zeros(len(center), dtype=bool)
+
+    # only boxes that grew can have new partners after the first pass
+    changed = None
+
+    for _ in range(max_passes):
+        alive = np.nonzero(~removed)[0]
+        if len(alive) < 2:
+            break
+
+        c = center[alive]
+        r = axes[alive]
+        h = half[alive]
+        vol = np.prod(h, axis=1)
+
+        # boxes are ranked by volume with ties broken by index, the larger of two boxes always has the higher rank
+        #   so two boxes can't delete each other and a chain of contained boxes collapses into its top box in one pass
+        rank = np.empty(len(alive), dtype=np.int64)
+        rank[np.argsort(vol, kind='stable')] = np.arange(len(alive))
+
+        extent = np.einsum('nij,ni->nj', np.abs(r), h)
+        slack = tolerance * np.max(h, axis=1)[:, None]
+
+        # a box that grew in this pass keeps its new bounds in its own frame, it can't be deleted or merged away until the next pass
+        gone = np.zeros(len(alive), dtype=bool)
+        grown = np.zeros(len(alive), dtype=bool)
+        grow_min = -h.copy()
+        grow_max = h.copy()
+
+        lo = c - extent - slack
+        hi = c + extent + slack
+        if changed is None:
+            pairs = iter_candidate_pairs(lo, hi, chunk_size, gone)
+        else:
+            pairs = iter_partner_pairs(lo, hi, np.nonzero(changed[alive])[0], chunk_size, gone)
+
+        for ia, ib in pairs:
+            # a is the larger box of the pair, b the smaller one
+            i_big = rank[ia] > rank[ib]
+            a = np.where(i_big, ia, ib)
+            b = np.where(i_big, ib, ia)
+
+            # cheap tests on the world bounds first: b can only be inside a if its bounds are inside the bounds of a,
+            #   and b can only be merged into a if they share their axes and their bounds overlap by the threshold
+            inside = np.all((c[b] - extent[b] >= lo[a] - slack[a]) & (c[b] + extent[b] <= hi[a] + slack[a]), axis=1)
+            bounds_overlap = np.prod(np.clip(np.minimum(hi[a], hi[b]) - np.maximum(lo[a], lo[b]), 0.0, None), axis=1)
+            maybe_merge = np.nonzero(~inside & (bounds_overlap >= overlap_threshold * 8.0 * vol[b]))[0]
+
+            # the first axis of a has to match one axis of b before all the axes are compared
+            first_dots = np.abs(np.einsum('mk,mjk->mj', r[a[maybe_merge], 0], r[b[maybe_merge]]))
+            maybe_merge = maybe_merge[np.max(first_dots, axis=1) >= 1.0 - tolerance]
+
+            keep = np.union1d(np.nonzero(inside)[0], maybe_merge)
+            if len(keep) == 0:
+                continue
+
+            ia, ib, i_big, a, b = ia[keep], ib[keep], i_big[keep], a[keep], b[keep]
+
+            dots = np.abs(np.matmul(r[a], r[b].transpose(0, 2, 1)))
+            parallel = np.all(np.max(dots, axis=2) >= 1.0 - tolerance, axis=1)
+
+            # corners of b in the frame of a
+            corners_b = c[b][:, None, :] + np.matmul(BOX_SIGNS * h[b][:, None, :], r[b])
+            local_b = np.matmul(corners_b - c[a][:, None, :], r[a].transpose(0, 2, 1))
+            tol = (tolerance * np.max(h[a], axis=1))[:, None, None]
+            contained = np.all(np.abs(local_b) <= h[a][:, None, :] + tol, axis=(1, 2))
+
+            # boxes that share their axes can be compared exactly in the frame of a
+            b_min = np.min(local_b, axis=1)
+            b_max = np.max(local_b, axis=1)
+            overlap = np.prod(np.clip(np.minimum(h[a], b_max) - np.maximum(-h[a], b_min), 0.0, None), axis=1)
+            ratio = overlap / np.maximum(8.0 * vol[b], 1e-30)
+            merge = parallel & ~contained & (ratio >= overlap_threshold)
+
+            act = np.nonzero(contained | merge)[0]
+            if len(act) == 0:
+                continue
+
+            ia, ib, i_big = ia[act], ib[act], i_big[act]
+            contained, merge, b_min, b_max = contained[act], merge[act], b_min[act], b_max[act]
+
+            # the pairs are grouped by the box that comes first in the sweep, handle all pairs of that box at once
+            rows, starts = np.unique(ia, return_index=True)
+            ends = np.append(starts[1:], len(ia))
+            for i, start, end in zip(rows, starts, ends):
+                if gone[i]:
+                    continue
+
+                js = ib[start:end]
+                big = i_big[start:end]
+                free = ~gone[js]
+                free_small = free & big & ~grown[js]
+
+                # i sits inside a larger box
+                if not grown[i] and np.any(~big & contained[start:end] & free):
+                    gone[i] = True
+                    continue
+
+                # delete the boxes inside i, i itself doesn't change
+                gone[js[free_small & contained[start:end]]] = True
+
+                # grow i over the smaller boxes it overlaps
+                m = free_small & merge[start:end]
+                if np.any(m):
+                    grow_min[i] = np.minimum(grow_min[i], np.min(b_min[start:end][m], axis=0))
+                    grow_max[i] = np.maximum(grow_max[i], np.max(b_max[start:end][m], axis=0))
+                    grown[i] = True
+                    gone[js[m]] = True
+
+                # grow the first larger box i overlaps over i
+                if not grown[i]:
+                    m = np.nonzero(free & ~big & merge[start:end])[0]
+                    if len(m) > 0:
+                        k = start + m[0]
+                        j = ib[k]
+                        grow_min[j] = np.minimum(grow_min[j], b_min[k])
+                        grow_max[j] = np.maximum(grow_max[j], b_max[k])
+                        grown[j] = True
+                        gone[i] = True
+
+        if not np.any(gone):
+            break
+
+        for i in np.nonzero(grown & ~gone)[0]:
+            center[alive[i]] = c[i] + ((grow_min[i] + grow_max[i]) * 0.5) @ r[i]
+            half[alive[i]] = (grow_max[i] - grow_min[i]) * 0.5
+            modified[alive[i]] = True
+
+        removed[alive[gone]] = True
+
+        # deletions alone can't give the remaining boxes new partners, only grown boxes need another pass
+        if not np.any(grown & ~gone):
+            break
+
+        changed = np.zeros(len(center), dtype=bool)
+        changed[alive[grown & ~gone]] = True
+
+    return removed, modified & ~removed
+
+def update_box_mesh(obj, center, axes, half, signs):
+    corners = center + (signs * half) @ axes
+
+    mat = np.array(obj.matrix_world)
+    inv = np.linalg.inv(mat)
+    local = corners @ inv[:3, :3].T + inv[:3, 3]
+
+    # don't move the boxes that share this mesh
+    if obj.data.users > 1:
+        obj.data = obj.data.copy()
+
+    mesh = obj.data
+    mesh.vertices.foreach_set("co", local.astype(np.float32).ravel())
+    mesh.update()
+
+def get_collision_collections(context, all_collections):
+    if all_collections:
+        return [coll for coll in bpy.data.collections if coll.name.startswith("Collision_")]
+
+    colls = []
+    candidates = [context.collection]
+    for obj in context.selected_objects:
+        candidates.extend(obj.users_collection)
+
+    for coll in candidates:
+        if coll is not None and coll.name.startswith("Collision_") and coll not in colls:
+            colls.append(coll)
+
+    return colls
+
+def merge_collection(coll, overlap_threshold, tolerance):
+    # returns the number of removed and resized boxes
+    objs = [obj for obj in coll.objects if obj.type == 'MESH' and obj.name.startswith("UBX_")]
+    boxes, center, axes, half, signs = find_boxes(objs, tolerance)
+    if len(boxes) < 2:
+        return 0, 0
+
+    removed, modified = merge_boxes(center, axes, half, overlap_threshold, tolerance)
+
+    for i in np.nonzero(modified)[0]:
+        update_box_mesh(boxes[i], center[i], axes[i], half[i], signs[i])
+
+    for i in np.nonzero(removed)[0]:
+        bpy.data.objects.remove(boxes[i], do_unlink=True)
+
+    return int(np.sum(removed)), int(np.sum(modified))
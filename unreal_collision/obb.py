@@ -0,0 +1,162 @@
+
+# oriented box fitting
+
+import numpy as np
+from .common import BOX_SIGNS, get_local_verts, get_world_bounds, get_world_verts
+from .hull import get_cached_mesh_hull, get_mesh_hull, merge_hulls
+
+# the local box is used as is when it is at most this fraction larger than the hull, no box can be noticeably smaller
+ALIGNED_TOLERANCE = 0.02
+
+# the local axes are taken as the PCA axes when no correlation between two local coordinates is larger than this
+ALIGNED_CORRELATION = 1e-3
+
+# a box is flat when its smallest extent is at most this fraction of its largest
+FLAT_RATIO = 1e-6
+
+def find_obb_corners(verts):
+    points = np.asarray(verts)
+
+    cov = np.cov(points, y = None,rowvar = 0,bias = 1)
+
+    v, vect = np.linalg.eig(cov)
+
+    tvect = np.transpose(vect)
+    points_r = np.dot(points, np.linalg.inv(tvect))
+
+    co_min = np.min(points_r, axis=0)
+    co_max = np.max(points_r, axis=0)
+
+    xmin, xmax = co_min[0], co_max[0]
+    ymin, ymax = co_min[1], co_max[1]
+    zmin, zmax = co_min[2], co_max[2]
+
+    xdif = (xmax - xmin) * 0.5
+    ydif = (ymax - ymin) * 0.5
+    zdif = (zmax - zmin) * 0.5
+
+    cx = xmin + xdif
+    cy = ymin + ydif
+    cz = zmin + zdif
+
+    corners = np.array([
+        [cx + xdif, cy + ydif, cz - zdif],
+        [cx + xdif, cy - ydif, cz - zdif],
+        [cx - xdif, cy - ydif, cz - zdif],
+        [cx - xdif, cy + ydif, cz - zdif],
+        [cx + xdif, cy + ydif, cz + zdif],
+        [cx + xdif, cy - ydif, cz + zdif],
+        [cx - xdif, cy - ydif, cz + zdif],
+        [cx - xdif, cy + ydif, cz + zdif],
+    ])
+
+    return np.dot(corners, tvect)
+
+def is_diagonal(cov, tolerance=ALIGNED_CORRELATION):
+    # true when no two coordinates are correlated, the coordinate axes are then the PCA axes
+    limit = tolerance * np.sqrt(np.outer(np.diag(cov), np.diag(cov)))
+    return bool(np.all(np.abs(cov - np.diag(np.diag(cov))) <= limit))
+
+def get_box_measure(extents):
+    # flat boxes are compared by the area of their largest face, any flat box is smaller than a solid one
+    extents = np.sort(extents)
+    if extents[0] <= extents[2] * FLAT_RATIO:
+        return 0, float(extents[1] * extents[2])
+    return 1, float(np.prod(extents))
+
+def find_single_obb_corners(obj, tolerance=ALIGNED_TOLERANCE):
+    # returns the world space corners of the smaller of the object's local bounds and its PCA box,
+    #   or None when the object matrix has shear so the local bounds are no box in world space
+    # the vertices are read once and stay in local space, the PCA box is only built when the cheap tests can't rule it out
+    mat = np.array(obj.matrix_world)
+    rot = mat[:3, :3]
+    scale = np.linalg.norm(rot, axis=0)
+    if np.max(np.abs((rot / scale).T @ (rot / scale) - np.eye(3))) > 1e-5:
+        return None
+
+    # argmin and argmax along the first axis are several times faster than min and max, and give the extreme points as well
+    co = get_local_verts(obj)
+    extreme_index = np.concatenate((np.argmin(co, axis=0), np.argmax(co, axis=0)))
+    extremes = co[extreme_index]
+    co_min = np.diag(extremes[:3])
+    co_max = np.diag(extremes[3:])
+
+    half = (co_max - co_min) * 0.5
+    corners = (co_min + half + BOX_SIGNS * half) @ rot.T + mat[:3, 3]
+
+    # rotation and non uniform scale keep a diagonal covariance diagonal, PCA of the world points then gives the local bounds
+    #   the points are moved to the middle of their bounds first so the sums keep their precision far from the origin
+    centered = co - (co_min + half)
+    mean = np.ones(len(co)) @ centered / len(co)
+    cov = centered.T @ centered / len(co) - np.outer(mean, mean)
+    if is_diagonal(cov):
+        return corners
+
+    # the PCA axes of the world points from the world covariance rot cov rot^T, project maps local points onto them
+    _, pca_axes = np.linalg.eigh(rot @ cov @ rot.T)
+    project = rot.T @ pca_axes
+
+    # the widths of any of the points along the PCA axes bound the PCA box from below,
+    #   the local extreme points are enough to rule it out for most meshes modeled axis-aligned
+    local_measure = get_box_measure((co_max - co_min) * scale)
+    extremes = extremes @ project
+    if get_box_measure(np.max(extremes, axis=0) - np.min(extremes, axis=0)) >= local_measure:
+        return corners
+
+    # any box around the points holds their hull, so the hull volume bounds every box from below
+    #   volume ratios are the same in local and world space
+    #   only a hull that is already cached is used, building one costs as much as the PCA box it would save
+    #   flat meshes have no hull volume, they are left to the PCA box
+    hull = get_cached_mesh_hull(obj, co)
+    if hull is not None and hull[1] > 0.0 and float(np.prod(co_max - co_min)) <= hull[1] * (1.0 + tolerance):
+        return corners
+
+    # only keep the PCA box if it improves the fit
+    points = co @ project
+    p_min = points[np.argmin(points, axis=0), [0, 1, 2]]
+    p_max = points[np.argmax(points, axis=0), [0, 1, 2]]
+    if get_box_measure(p_max - p_min) >= local_measure:
+        return corners
+
+    p_half = (p_max - p_min) * 0.5
+    return (p_min + p_half + BOX_SIGNS * p_half) @ pca_axes.T + mat[:3, 3]
+
+def find_group_obb_corners(objs):
+    # returns the world space corners of the box around several objects
+    # the axes come from PCA of the merged hull of the object hulls, the outer shell of the group without the dense surfaces
+    #   in between, the object hulls only hold extreme vertices so the extents come from projecting every vertex onto the axes
+    meshes = []
+    hulls = []
+    for obj in objs:
+        mat = np.array(obj.matrix_world)
+        co = get_local_verts(obj)
+        meshes.append((co, mat))
+        hulls.append(get_mesh_hull(obj, co)[0] @ mat[:3, :3].T + mat[:3, 3])
+
+    shell = merge_hulls(hulls)
+    centered = shell - np.mean(shell, axis=0)
+    _, axes = np.linalg.eigh(centered.T @ centered)
+
+    p_min = np.full(3, np.inf)
+    p_max = np.full(3, -np.inf)
+    for co, mat in meshes:
+        points = co @ (mat[:3, :3].T @ axes) + mat[:3, 3] @ axes
+        p_min = np.minimum(p_min, points[np.argmin(points, axis=0), [0, 1, 2]])
+        p_max = np.maximum(p_max, points[np.argmax(points, axis=0), [0, 1, 2]])
+
+    half = (p_max - p_min) * 0.5
+    return (p_min + half + BOX_SIGNS * half) @ axes.T
+
+def fit_obb(objs):
+    # returns the box corners relative to the box location and the location in world space
+    if len(objs) == 1:
+        corners = find_single_obb_corners(objs[0])
+        if corners is None:
+            corners = find_obb_corners(get_world_verts(objs[0]))
+    else:
+        corners = find_group_obb_corners(objs)
+
+    co_min, co_max = get_world_bounds(objs)
+    center = co_min + ((co_max - co_min) / 2)
+
+    return corners - center, center
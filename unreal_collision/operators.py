@@ -0,0 +1,256 @@
+
+# operator classes, only bpy is imported here
+# the fitting modules (and numpy, bmesh, mathutils with them) are imported the first time an operator runs
+
+import os
+import bpy
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, FloatVectorProperty, IntProperty, StringProperty
+from bpy_extras import object_utils
+
+KDOP_TYPES = (
+    ('DOP10_X', "10-DOP X", "Box with the edges parallel to X beveled"),
+    ('DOP10_Y', "10-DOP Y", "Box with the edges parallel to Y beveled"),
+    ('DOP10_Z', "10-DOP Z", "Box with the edges parallel to Z beveled"),
+    ('DOP18', "18-DOP", "Box with all edges beveled"),
+    ('DOP26', "26-DOP", "Box with all edges and corners beveled"),
+)
+
+class CollisionAddHelper(object_utils.AddObjectHelper):
+    view_align : BoolProperty(name="Align to View", default=False,)
+    location : FloatVectorProperty(name="Location", subtype='TRANSLATION',)
+    rotation : FloatVectorProperty(name="Rotation", subtype='EULER',)
+
+    # one collision object per selected object instead of one for the whole selection
+    per_object = False
+
+    # fitting reads the vertices, otherwise only the bound boxes are used
+    mesh_only = True
+
+    @classmethod
+    def poll(cls, context):
+        if len(context.selected_objects) == 0:
+            return False
+        return True
+
+    def execute(self, context):
+        from .common import get_base_name
+
+        objs = context.selected_objects
+        if self.mesh_only:
+            objs = [obj for obj in objs if obj.type == 'MESH' and len(obj.data.vertices) > 0]
+
+        if len(objs) == 0:
+            self.report({'WARNING'}, "No mesh objects selected")
+            return {'CANCELLED'}
+
+        groups = [[obj] for obj in objs] if self.per_object else [objs]
+        for group in groups:
+            self.add_collision(context, group, get_base_name(group[0].name))
+
+        return {'FINISHED'}
+
+class AABBHelper(CollisionAddHelper):
+    mesh_only = False
+
+    def add_collision(self, context, objs, base_name):
+        from . import aabb, common
+
+        corners, center = aabb.fit_aabb(objs)
+        common.add_collision_object(self, context, "UBX_", base_name, "UBX_AABB", common.new_box_bmesh(corners), center)
+
+class OBBHelper(CollisionAddHelper):
+    def add_collision(self, context, objs, base_name):
+        from . import common, obb
+
+        corners, center = obb.fit_obb(objs)
+        common.add_collision_object(self, context, "UBX_", base_name, "UBX_OBB", common.new_box_bmesh(corners), center)
+
+class KDOPHelper(CollisionAddHelper):
+    def add_collision(self, context, objs, base_name):
+        from . import common, kdop
+
+        corners, center = kdop.fit_kdop(objs, self.kdop_type)
+        common.add_collision_object(self, context, "UCX_", base_name, "UCX_KDOP", kdop.new_kdop_bmesh(corners), center)
+
+class CreateAABB(bpy.types.Operator, AABBHelper):
+    """Create a mesh AABB that encompasses all selected objects"""
+    bl_idname = "mesh.boundbox_add"
+    bl_label = "Create Unreal Collision AABB"
+    bl_description = "Create a mesh AABB that encompasses all selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+class CreateAABBObjects(bpy.types.Operator, AABBHelper):
+    """Create a mesh AABB for each individual selected object"""
+    bl_idname = "mesh.boundbox_add_each"
+    bl_label = "Create Unreal Collision AABB Objects"
+    bl_description = "Create a mesh AABB for each individual selected object."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    per_object = True
+
+class CreateOBB(bpy.types.Operator, OBBHelper):
+    """Create a mesh OBB that encompasses all selected objects"""
+    bl_idname = "mesh.obb_add"
+    bl_label = "Create Unreal Collision OBB"
+    bl_description = "Create a mesh OBB that encompasses all selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+class CreateOBBObjects(bpy.types.Operator, OBBHelper):
+    """Create a mesh OBB for each individual selected object."""
+    bl_idname = "mesh.obb_add_each"
+    bl_label = "Create Unreal Collision OBB Objects"
+    bl_description = "Create a mesh OBB for each individual selected object."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    per_object = True
+
+class CreateKDOP(bpy.types.Operator, KDOPHelper):
+    """Create a mesh k-DOP that encompasses all selected objects"""
+    bl_idname = "mesh.kdop_add"
+    bl_label = "Create Unreal Collision KDOP"
+    bl_description = "Create a mesh k-DOP that encompasses all selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    kdop_type : EnumProperty(name="Type", items=KDOP_TYPES, default='DOP18',)
+
+class CreateKDOPObjects(bpy.types.Operator, KDOPHelper):
+    """Create a mesh k-DOP for each individual selected object"""
+    bl_idname = "mesh.kdop_add_each"
+    bl_label = "Create Unreal Collision KDOP Objects"
+    bl_description = "Create a mesh k-DOP for each individual selected object."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    kdop_type : EnumProperty(name="Type", items=KDOP_TYPES, default='DOP18',)
+
+    per_object = True
+
+class MergeUBX(bpy.types.Operator):
+    """Delete or merge duplicate, contained and heavily overlapping UBX_ boxes"""
+    bl_idname = "object.ubx_merge"
+    bl_label = "Merge Unreal Collision Boxes"
+    bl_description = "Delete or merge duplicate, contained and heavily overlapping UBX_ boxes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    all_collections : BoolProperty(name="All Collision Collections", default=False,)
+    overlap_threshold : FloatProperty(
+        name="Overlap Threshold",
+        description="Merge boxes that share their orientation when the overlap is at least this fraction of the smaller box",
+        default=0.8, min=0.0, max=1.0, subtype='FACTOR',
+    )
+    tolerance : FloatProperty(
+        name="Tolerance",
+        description="Relative tolerance used to treat boxes as identical, contained or parallel",
+        default=0.001, min=0.0, max=0.1,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        from . import merge
+
+        colls = merge.get_collision_collections(context, self.all_collections)
+        if len(colls) == 0:
+            self.report({'WARNING'}, "No Collision_ collection selected")
+            return {'CANCELLED'}
+
+        removed_count = 0
+        modified_count = 0
+        for coll in colls:
+            removed, modified = merge.merge_collection(coll, self.overlap_threshold, self.tolerance)
+            removed_count += removed
+            modified_count += modified
+
+        self.report({'INFO'}, "Removed %d boxes, resized %d boxes" % (removed_count, modified_count))
+        return {'FINISHED'}
+
+class AuditCollision(bpy.types.Operator):
+    """Write a report of the collision coverage and cost of every asset in the scene"""
+    bl_idname = "object.unreal_collision_audit"
+    bl_label = "Audit Unreal Collision"
+    bl_description = "Write a report of the collision coverage and cost of every asset in the scene"
+    bl_options = {'REGISTER'}
+
+    filepath : StringProperty(name="File Path", description="Report file, .json writes json, anything else csv", subtype='FILE_PATH',)
+    oversize_ratio : FloatProperty(
+        name="Oversize Ratio",
+        description="Flag collision whose bounds are this many times larger than the bounds of its asset",
+        default=4.0, min=1.0,
+    )
+
+    def set_default_filepath(self):
+        # next to the blend file, or in the working directory for unsaved files and scripts
+        if not self.filepath:
+            self.filepath = bpy.path.ensure_ext(bpy.path.abspath("//collision_audit") if bpy.data.filepath else "collision_audit", ".csv")
+
+    def invoke(self, context, event):
+        self.set_default_filepath()
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        from . import audit
+
+        # called from a script without a file path
+        self.set_default_filepath()
+
+        rows = audit.audit_scene(context.scene, oversize_ratio=self.oversize_ratio)
+        try:
+            audit.write_report(rows, bpy.path.abspath(self.filepath))
+        except OSError as e:
+            self.report({'ERROR'}, "Can't write the audit report: %s" % e)
+            return {'CANCELLED'}
+
+        summary = audit.get_summary(rows)
+        self.report({'INFO'}, "%d assets, %d primitives: %d ok, %d missing, %d stale, %d misfit, %d orphan" % (
+            summary["assets"], summary["primitives"], summary["ok"], summary["missing"], summary["stale"], summary["misfit"], summary["orphan"]))
+        return {'FINISHED'}
+
+class ExportCollisionFBX(bpy.types.Operator):
+    """Export every asset with its collision to its own fbx file"""
+    bl_idname = "export_scene.unreal_collision_fbx"
+    bl_label = "Export Unreal Collision Assets"
+    bl_description = "Export every asset with its collision to its own fbx file"
+    bl_options = {'REGISTER'}
+
+    directory : StringProperty(name="Directory", subtype='DIR_PATH',)
+    workers : IntProperty(
+        name="Workers",
+        description="Number of background Blender processes exporting at the same time",
+        default=min(4, os.cpu_count() or 1), min=1, max=64,
+    )
+    force : BoolProperty(name="Export Unchanged Assets", description="Also export the assets that didn't change since the last export", default=False,)
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        from . import export
+
+        if not self.directory:
+            self.report({'WARNING'}, "No export directory")
+            return {'CANCELLED'}
+
+        exported, skipped, failed, errors = export.export_assets(context, bpy.path.abspath(self.directory), self.workers, self.force)
+        for error in errors:
+            self.report({'ERROR'}, error)
+
+        self.report({'WARNING'} if failed > 0 else {'INFO'}, "Exported %d assets, skipped %d unchanged, %d failed" % (exported, skipped, failed))
+        return {'FINISHED'}
+
+add_classes = (
+    CreateAABB,
+    CreateAABBObjects,
+    CreateOBB,
+    CreateOBBObjects,
+    CreateKDOP,
+    CreateKDOPObjects,
+)
+
+classes = add_classes + (
+    MergeUBX,
+    AuditCollision,
+    ExportCollisionFBX,
+)